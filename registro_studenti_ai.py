@@ -2,13 +2,113 @@
 
 import os  # Module to interact with the operating system
 import json  # Module to work with data in JSON format (JavaScript Object Notation)
-from typing import List, Dict  # Type annotations to improve code readability
+import mmap  # Module to map the content of a file in memory
+import re  # Module for regular expressions
+import stat  # Module to interpret the file information returned by os.stat()
+import sys  # Module to access command line arguments and standard input
+import tempfile  # Module to create temporary files with unique names
+from typing import Any, BinaryIO, List, Dict, Optional, Sequence, Tuple, TypedDict, Union  # Type annotations to improve code readability
+
+try:
+    import orjson  # Fast JSON library (optional): parses and produces bytes directly
+    _ORJSON_DISPONIBILE = True
+except ImportError:
+    _ORJSON_DISPONIBILE = False  # Falls back to the standard json module
+
+
+class Studente(TypedDict):
+    """
+    Structure of the dictionary that represents a student in the registry.
+    
+    Note:
+        - A TypedDict is a normal dictionary at runtime: it only declares which keys
+          it has and their types, so type checkers (and compilers such as mypyc)
+          can verify and optimize the code that uses it
+    """
+    matricola: str
+    nome: str
+    cognome: str
+    voti: List[int]
+
+
+class _StatoRegistro(TypedDict):
+    """
+    Structure of the registry kept in memory by carica_studenti().
+    """
+    percorso: Optional[str]  # File that has been read (None before the first reading)
+    firma: Optional[Tuple[int, int]]  # (modification time, size) of the file when it was read
+    studenti: List[Studente]
+    indice: Dict[str, int]  # Index {student ID: position in the list}
+
 
 main_dir = os.path.dirname(__file__)  # Gets the directory containing the script
 file_path = os.path.join(main_dir, 'registro.txt')  # Composes the complete file path
 
+# Cache of the grade averages already calculated, keyed by the identity of the student's
+# dictionary (id()), so students with the same (or missing) student ID never share an entry.
+# Each value is (student, number of grades, average): keeping a reference to the student
+# prevents its id() from being reused by another dictionary while the entry exists.
+# The functions that modify the grades remove the stale entry, and the cache is emptied
+# whenever carica_studenti() reads the file again
+_media_cache: Dict[int, Tuple[Studente, int, float]] = {}
+
+# Regular expression of a grade: a sequence of decimal digits (\d also matches digits of
+# other alphabets, e.g. "２０", which int() converts correctly), possibly surrounded
+# by spaces; compiled only once when the module is loaded. The 18-30 range is checked
+# on the converted number
+_VOTO_RE = re.compile(r"\s*(\d+)\s*")
+
+# Registry kept in memory: the file is read again (by carica_studenti) only when its
+# modification time or size ("firma") changes, and the functions that modify it
+# update the list and the index before saving it
+_registro: _StatoRegistro = {"percorso": None, "firma": None, "studenti": [], "indice": {}}
+
+
+def _serializza_studenti(studenti: List[Studente]) -> bytes:
+    """
+    Converts the list of students into UTF-8 encoded JSON bytes, ready to be written.
+
+    Args:
+        studenti: List of dictionaries, each representing a student
+
+    Returns:
+        bytes: Compact JSON document (no indentation and no spaces after separators)
+
+    Note:
+        - Uses orjson when available: it is much faster than the json module and
+          produces bytes directly, skipping the str -> bytes encoding step
+        - orjson always writes non-ASCII characters as UTF-8, like ensure_ascii=False
+        - The file is meant to be read by the program, so the compact format is used:
+          it is faster to produce and smaller than the indented one
+    """
+    if _ORJSON_DISPONIBILE:
+        return orjson.dumps(studenti)
+    return json.dumps(studenti, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
-def leggi_studenti_da_file(percorso_file: str) -> List[Dict]:
+def _deserializza_json(contenuto: Union[bytes, memoryview]) -> Any:
+    """
+    Converts UTF-8 encoded JSON bytes into the corresponding Python data structure.
+    
+    Args:
+        contenuto: JSON document read from a file or from the standard input
+                   (bytes or another bytes-like object, such as a memoryview)
+        
+    Returns:
+        The decoded data (for the registry, a list of dictionaries)
+        
+    Note:
+        - Uses orjson when available, otherwise the standard json module
+        - Raises ValueError if the content is not valid JSON: json.JSONDecodeError
+          (orjson.JSONDecodeError is a subclass of it), or UnicodeDecodeError from
+          the json module if the bytes are not valid UTF-8
+    """
+    if _ORJSON_DISPONIBILE:
+        return orjson.loads(contenuto)
+    return json.loads(bytes(contenuto))  # json accepts only str, bytes and bytearray
+
+
+def leggi_studenti_da_file(percorso_file: str) -> List[Studente]:
     """
     Reads the JSON file and returns the list of students as a list of dictionaries.
     
@@ -16,24 +116,166 @@ def leggi_studenti_da_file(percorso_file: str) -> List[Dict]:
         percorso_file: Complete path of the JSON file to read
         
     Returns:
-        List[Dict]: List of dictionaries, each representing a student
+        List[Studente]: List of dictionaries, each representing a student
                    Returns empty list in case of error
     
     Note:
-        - Uses encoding='utf-8' to correctly handle special characters
+        - Reads the file as bytes: the JSON is decoded as UTF-8 to correctly handle special characters
+        - Maps the file in memory with mmap: the JSON is parsed directly from the
+          operating system's pages, without first copying it into a bytes object
+        - Uses orjson when available, otherwise the standard json module
         - Handles two possible exceptions:
           * FileNotFoundError: when the file doesn't exist
-          * JSONDecodeError: when the file exists but doesn't contain valid JSON
+          * ValueError: when the file is empty (it cannot be mapped) or doesn't contain
+            valid JSON (JSONDecodeError is a subclass of ValueError)
     """
     try:
-        with open(percorso_file, encoding='utf-8') as file:  # 'with' ensures the file is closed
-            return json.load(file)  # Converts JSON into Python data structure
-    except (json.JSONDecodeError, FileNotFoundError):
+        with open(percorso_file, "rb") as file:  # 'with' ensures the file is closed
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mappa:
+                with memoryview(mappa) as contenuto:  # Released before closing the map
+                    return _deserializza_json(contenuto)  # Converts JSON into Python data structure
+    except (ValueError, FileNotFoundError):
         print("❌ Error in JSON file or file not found.")
         return []  # Returns an empty list in case of error
 
 
-def calcola_media(voti: List[float]) -> float:
+def indicizza_studenti(studenti: List[Studente]) -> Dict[str, int]:
+    """
+    Builds an index that associates each student ID with its position in the list.
+    
+    Args:
+        studenti: List of dictionaries, each representing a student
+        
+    Returns:
+        Dict[str, int]: Dictionary {student ID: index in the list}
+        
+    Note:
+        - Looking up a key in a dictionary takes constant time, while searching
+          the list requires scanning it element by element
+        - setdefault() keeps the first position if the same student ID appears
+          more than once, just like a search from the start of the list
+    """
+    indice: Dict[str, int] = {}
+    for index, studente in enumerate(studenti):
+        indice.setdefault(studente.get("matricola"), index)
+    return indice
+
+
+def _firma_file(percorso_file: str) -> Optional[Tuple[int, int]]:
+    """
+    Returns the modification time (in nanoseconds) and the size of a file.
+    
+    Args:
+        percorso_file: Complete path of the file
+        
+    Returns:
+        Optional[Tuple[int, int]]: (st_mtime_ns, st_size), or None if the file doesn't exist
+        
+    Note:
+        - os.stat() reads only the file information, not its content: it is a cheap
+          way to find out if another program has modified the file
+    """
+    try:
+        info = os.stat(percorso_file)
+    except FileNotFoundError:
+        return None
+    return (info.st_mtime_ns, info.st_size)
+
+
+def carica_studenti(percorso_file: str) -> List[Studente]:
+    """
+    Returns the list of students, reading the file only when it has changed.
+    
+    Args:
+        percorso_file: Complete path of the data file
+        
+    Returns:
+        List[Studente]: The list kept in memory in _registro (the same object on every call)
+        
+    Note:
+        - The following calls reuse the list already in memory instead of parsing
+          the whole file again at every operation
+        - The file is read again if its modification time or size has changed,
+          e.g. because students were imported with --importa by another process
+        - Also builds the student ID index used to look up students
+    """
+    firma = _firma_file(percorso_file)
+    if _registro["percorso"] != percorso_file or _registro["firma"] != firma:
+        studenti = leggi_studenti_da_file(percorso_file)
+        _registro["percorso"] = percorso_file
+        _registro["firma"] = firma
+        _registro["studenti"] = studenti
+        _registro["indice"] = indicizza_studenti(studenti)
+        _media_cache.clear()  # The averages calculated for the old data are no longer valid
+    return _registro["studenti"]
+
+
+def _scrittura_atomica(percorso_file: str, contenuto: bytes):
+    """
+    Replaces the content of a file so that it is never left half-written.
+    
+    Args:
+        percorso_file: Complete path of the file to write
+        contenuto: Bytes to write in the file
+        
+    Note:
+        - Writes into a temporary file next to the original one ("<file>.<random>.tmp"):
+          tempfile.mkstemp() gives it a unique name, so two processes saving at the
+          same time never write into the same temporary file
+        - mkstemp() creates the file readable only by its owner: the permissions of the
+          original file (or the default ones, for a new file) are copied onto it
+        - os.fsync() forces the operating system to save the data on disk
+        - os.replace() then swaps the two files in a single operation: if the program
+          stops while writing, the old file is still intact
+        - If any step fails, the temporary file is removed and the error is raised again
+    """
+    try:
+        permessi = stat.S_IMODE(os.stat(percorso_file).st_mode)
+    except FileNotFoundError:
+        maschera = os.umask(0)  # os.umask() returns the current mask only by changing it
+        os.umask(maschera)
+        permessi = 0o666 & ~maschera  # Same permissions that open() would give
+
+    cartella = os.path.dirname(percorso_file) or "."  # Same folder: os.replace() needs it
+    descrittore, percorso_tmp = tempfile.mkstemp(
+        dir=cartella, prefix=os.path.basename(percorso_file) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(descrittore, "wb") as file:  # Turns the descriptor into a file object
+            os.chmod(percorso_tmp, permessi)
+            file.write(contenuto)
+            file.flush()  # Empties Python's buffer before asking the system to save
+            os.fsync(file.fileno())
+        os.replace(percorso_tmp, percorso_file)
+    except BaseException:  # Also KeyboardInterrupt: the temporary file must not be left behind
+        try:
+            os.remove(percorso_tmp)
+        except OSError:
+            pass  # Already moved or removed: nothing to remove
+        raise  # Raises again the original error
+
+
+def salva_studenti(percorso_file: str, studenti: List[Studente]):
+    """
+    Saves the list of students to the JSON file.
+    
+    Args:
+        percorso_file: Complete path of the data file
+        studenti: List of dictionaries, each representing a student
+        
+    Note:
+        - Non-ASCII characters (e.g. accented letters) are saved as UTF-8
+        - The file is written with _scrittura_atomica(), so an interrupted save
+          does not corrupt the registry
+        - Updates the signature saved in _registro, so that the next call to
+          carica_studenti() does not read again the file just written
+    """
+    _scrittura_atomica(percorso_file, _serializza_studenti(studenti))
+    if _registro["percorso"] == percorso_file:
+        _registro["firma"] = _firma_file(percorso_file)
+
+
+def calcola_media(voti: Sequence[float]) -> float:
     """
     Calculates the arithmetic mean of a list of numeric grades.
     
@@ -45,14 +287,16 @@ def calcola_media(voti: List[float]) -> float:
         
     Note:
         - Filters only numeric values (integers or decimals) from the list
+        - Compares the exact type with type(v) in (int, float): it is cheaper than
+          isinstance() and also excludes booleans (True/False are a subclass of int)
         - Uses list comprehension to create a new filtered list
         - Checks that the list is not empty before calculating the average
     """
-    voti_validi = [v for v in voti if isinstance(v, (int, float))]  # Filters only valid numbers
+    voti_validi = [v for v in voti if type(v) in (int, float)]  # Filters only valid numbers
     return sum(voti_validi) / len(voti_validi) if voti_validi else 0.0  # Avoids division by zero
 
 
-def stampa_studenti(studenti: List[Dict]):
+def stampa_studenti(studenti: List[Studente]):
     """
     Prints on screen the list of students with their data.
     
@@ -63,16 +307,26 @@ def stampa_studenti(studenti: List[Dict]):
         - For each student shows: student ID, first name, last name and grade average
         - Uses the .get() method of dictionaries which allows to specify
           a default value ('N/D' = Not Available) if the key doesn't exist
+        - Reuses the averages saved in _media_cache, so printing the list again
+          does not recalculate them; calcola_media is called only on a cache miss
         - Formats the average with two decimals using f-string syntax {media:.2f}
+        - Collects all the lines in a list and writes them with a single call
+          to sys.stdout.write() instead of calling print() for every student
     """
-    print("\nStudent list:")
+    righe = ["\nStudent list:"]
     for studente in studenti:
         matricola = studente.get("matricola", "N/D")  # 'N/D' is the default value if the key doesn't exist
         nome = studente.get("nome", "N/D")
         cognome = studente.get("cognome", "N/D")
         voti = studente.get("voti", [])  # Empty list if the key doesn't exist
-        media = calcola_media(voti)
-        print(f"[{matricola}] {nome} {cognome} - Grade average: {media:.2f}")  # Formatting with f-string
+        voce = _media_cache.get(id(studente))
+        if voce is not None and voce[0] is studente and voce[1] == len(voti):
+            media = voce[2]
+        else:  # Not calculated yet: calculates and saves it in the cache
+            media = calcola_media(voti)
+            _media_cache[id(studente)] = (studente, len(voti), media)
+        righe.append(f"[{matricola}] {nome} {cognome} - Grade average: {media:.2f}")  # Formatting with f-string
+    sys.stdout.write("\n".join(righe) + "\n")  # join() joins the lines separating them with a newline
 
 
 def esegui_processo(percorso_file: str):
@@ -88,10 +342,65 @@ def esegui_processo(percorso_file: str):
           2. Displaying the data
         - It's an example of function composition: a function that uses others
     """
-    studenti = leggi_studenti_da_file(percorso_file)  # First reads the data
+    studenti = carica_studenti(percorso_file)  # First reads the data
     stampa_studenti(studenti)  # Then displays it
 
 
+def _registra_studenti(percorso_file: str, nuovi_studenti: List[Studente]):
+    """
+    Adds already validated students to the registry and saves the file once.
+    
+    Args:
+        percorso_file: Complete path of the data file
+        nuovi_studenti: List of dictionaries of the students to add
+        
+    Note:
+        - Shared by aggiungi_studente() and aggiungi_studenti_batch(): however many
+          students are added, the file is written only one time
+    """
+    studenti = carica_studenti(percorso_file)
+    indice = _registro["indice"]
+    for studente in nuovi_studenti:
+        indice.setdefault(studente["matricola"], len(studenti))  # Updates the index
+        studenti.append(studente)  # Adds the new student to the existing list
+
+    # Save the updated file
+    salva_studenti(percorso_file, studenti)
+
+
+def _valida_studente(dati: Any) -> Optional[Studente]:
+    """
+    Checks the data of a student read from a batch import.
+    
+    Args:
+        dati: Value decoded from the JSON input (should be a dictionary)
+        
+    Returns:
+        Optional[Studente]: The student with standardized keys, or None if the data is not valid
+        
+    Note:
+        - Applies the same rules as aggiungi_studente(): student ID, first name and last
+          name are mandatory, only grades that are integers between 18 and 30 are kept
+          and at least one valid grade is required
+    """
+    if not isinstance(dati, dict):
+        return None
+    campi = []
+    for chiave in ("matricola", "nome", "cognome"):
+        campo = dati.get(chiave)
+        if not isinstance(campo, str) or not campo.strip():
+            return None
+        campi.append(campo.strip())
+    voti = dati.get("voti")
+    if not isinstance(voti, list):
+        return None
+    voti = [v for v in voti if type(v) is int and 18 <= v <= 30]
+    if not voti:
+        return None
+    matricola, nome, cognome = campi
+    return {"matricola": matricola, "nome": nome, "cognome": cognome, "voti": voti}
+
+
 def aggiungi_studente(percorso_file: str):
     """
     Adds a new student by requesting data via input and saving it to the file.
@@ -131,20 +440,17 @@ def aggiungi_studente(percorso_file: str):
             break
         print("⚠️ Last name cannot be empty. Try again.")    # Request and validation of grades
     voti_input = input("Enter grades separated by commas (e.g. 24,26,30): ")
-    try:
-        # List comprehension with multiple conditions:
-        # 1. Splits the input based on commas
-        # 2. For each value, removes leading and trailing spaces
-        # 3. Verifies that it consists only of digits
-        # 4. Verifies that it is in the 18-30 range
-        # 5. Converts to integer
-        voti = [
-            int(v.strip()) 
-            for v in voti_input.split(",") 
-            if v.strip().isdigit() and 18 <= int(v.strip()) <= 30
-        ]
-    except ValueError:
-        voti = []  # In case of error, initialize with empty list
+    # List comprehension with a regular expression:
+    # 1. Splits the input based on commas
+    # 2. fullmatch() verifies that the value (ignoring spaces) is made only of digits;
+    #    the := operator saves the result in m
+    # 3. Converts to integer the digits captured by the group of the expression
+    #    (saved in voto) and verifies that the grade is in the 18-30 range
+    voti = [
+        voto
+        for v in voti_input.split(",")
+        if (m := _VOTO_RE.fullmatch(v)) and 18 <= (voto := int(m.group(1))) <= 30
+    ]
 
     # Verify that there is at least one valid grade
     if not voti:
@@ -155,27 +461,62 @@ def aggiungi_studente(percorso_file: str):
     # ---------------------------------
 
     # Create the new student as dictionary
-    nuovo_studente = {
+    nuovo_studente: Studente = {
         "matricola": matricola,
         "nome": nome,
         "cognome": cognome,
         "voti": voti
     }
 
-    # Load current students and add the new one
-    studenti = leggi_studenti_da_file(percorso_file)
-    studenti.append(nuovo_studente)  # Adds the new student to the existing list
-
-    # Save the updated file
-    with open(percorso_file, "w", encoding="utf-8") as file:
-        # ensure_ascii=False allows saving non-ASCII characters (e.g. accented letters)
-        # indent=2 formats JSON with 2-space indentation for better readability
-        json.dump(studenti, file, ensure_ascii=False, indent=2)
+    # Add the new student to the registry and save the file
+    _registra_studenti(percorso_file, [nuovo_studente])
 
     # Confirmation to user
     print(f"\n✅ Student {nome} {cognome} successfully added.")
 
 
+def aggiungi_studenti_batch(percorso_file: str, stream: BinaryIO) -> bool:
+    """
+    Adds many students at once, reading them as a JSON list from a stream.
+    
+    Args:
+        percorso_file: Complete path of the data file
+        stream: Binary stream containing the JSON list (e.g. sys.stdin.buffer)
+        
+    Returns:
+        bool: True if the import succeeded, False if the input was rejected (not valid
+              JSON, not a list, or a non-empty list where no student is valid)
+        
+    Note:
+        - Non-interactive alternative to aggiungi_studente(), useful to import data:
+          python registro_studenti_ai.py --importa < nuovi_studenti.json
+        - Reads the whole input with a single read() call
+        - Each student is validated with _valida_studente(): invalid ones are skipped
+        - All valid students are saved with a single write of the file
+        - Error messages are written to the standard error (file=sys.stderr), so a
+          calling script can tell them apart from the normal output
+    """
+    try:
+        dati = _deserializza_json(stream.read())
+    except ValueError:  # JSONDecodeError, or UnicodeDecodeError if the input is not UTF-8
+        print("❌ Error: the input is not valid JSON.", file=sys.stderr)
+        return False
+    if not isinstance(dati, list):
+        print("❌ Error: the input must be a JSON list of students.", file=sys.stderr)
+        return False
+
+    nuovi_studenti = [studente for d in dati if (studente := _valida_studente(d))]
+    scartati = len(dati) - len(nuovi_studenti)
+    if dati and not nuovi_studenti:
+        print(f"❌ Error: none of the {scartati} students is valid. Nothing added.", file=sys.stderr)
+        return False
+    if nuovi_studenti:
+        _registra_studenti(percorso_file, nuovi_studenti)
+
+    print(f"✅ {len(nuovi_studenti)} students added, {scartati} skipped because not valid.")
+    return True
+
+
 def aggiungi_voto(percorso_file: str):
     """
     Aggiunge un voto a uno studente esistente identificato per matricola.
@@ -184,26 +525,27 @@ def aggiungi_voto(percorso_file: str):
         percorso_file: Percorso completo del file dati
         
     Note:
-        - Cerca lo studente tramite la matricola usando la funzione next() con un generatore
+        - Cerca lo studente tramite la matricola usando l'indice creato da carica_studenti()
         - Valida il voto inserito assicurandosi che sia un intero tra 18 e 30
         - Usa il metodo setdefault() per gestire il caso in cui lo studente non abbia già voti
     """
     # Carica i dati attuali
-    studenti = leggi_studenti_da_file(percorso_file)
+    studenti = carica_studenti(percorso_file)
 
     # Richiesta della matricola
     matricola_input = input("Inserisci il numero di matricola: ").strip()
 
     # Ricerca dello studente con la matricola inserita
-    # La funzione next() prende:
-    # - Un generatore (espressione che produce valori uno alla volta)
-    # - Un valore di default (None) da restituire se il generatore è vuoto
-    studente_trovato = next((s for s in studenti if s.get("matricola") == matricola_input), None)
+    # get() restituisce la posizione dello studente, oppure None se la matricola non esiste
+    studente_index = _registro["indice"].get(matricola_input)
 
     # Verifica se lo studente è stato trovato
-    if not studente_trovato:
+    if studente_index is None:
         print(f"❌ Errore: Nessuno studente trovato con matricola {matricola_input}")
-        return  # Esce dalla funzione    # Richiesta e validazione del nuovo voto
+        return  # Esce dalla funzione
+    studente_trovato = studenti[studente_index]
+
+    # Richiesta e validazione del nuovo voto
     voto_input = input("Inserisci il nuovo voto: ").strip()
     try:
         voto = int(voto_input)  # Converte l'input in numero intero
@@ -216,11 +558,14 @@ def aggiungi_voto(percorso_file: str):
     # Aggiunta del voto all'elenco
     # setdefault() restituisce il valore della chiave se esiste o crea la chiave
     # con il valore di default specificato (lista vuota in questo caso)
-    studente_trovato.setdefault("voti", []).append(voto)
+    voti = studente_trovato.setdefault("voti", [])
+    voti.append(voto)
+
+    # La media salvata in cache per lo studente non è più valida
+    _media_cache.pop(id(studente_trovato), None)
 
     # Salvataggio nel file
-    with open(percorso_file, "w", encoding="utf-8") as file:
-        json.dump(studenti, file, ensure_ascii=False, indent=2)
+    salva_studenti(percorso_file, studenti)
 
     # Conferma all'utente
     print(f"✅ Voto {voto} aggiunto con successo a {studente_trovato['nome']} {studente_trovato['cognome']}.")
@@ -234,12 +579,14 @@ def cancella_studente(percorso_file: str):
         percorso_file: Percorso completo del file dati
         
     Note:
-        - Cerca lo studente tramite la matricola
+        - Cerca lo studente tramite la matricola usando l'indice creato da carica_studenti()
         - Richiede conferma prima di procedere con la cancellazione
+        - Sposta l'ultimo studente al posto di quello cancellato, quindi l'ordine
+          della lista può cambiare
         - Aggiorna il file JSON dopo la cancellazione
     """
     # Carica i dati attuali
-    studenti = leggi_studenti_da_file(percorso_file)
+    studenti = carica_studenti(percorso_file)
     
     # Se non ci sono studenti nel registro
     if not studenti:
@@ -250,11 +597,7 @@ def cancella_studente(percorso_file: str):
     matricola_input = input("Inserisci il numero di matricola dello studente da cancellare: ").strip()
     
     # Ricerca dello studente con la matricola inserita
-    studente_index = None
-    for index, studente in enumerate(studenti):
-        if studente.get("matricola") == matricola_input:
-            studente_index = index
-            break
+    studente_index = _registro["indice"].get(matricola_input)
     
     # Verifica se lo studente è stato trovato
     if studente_index is None:
@@ -272,11 +615,31 @@ def cancella_studente(percorso_file: str):
         return
     
     # Rimuovi lo studente dalla lista
-    studente_rimosso = studenti.pop(studente_index)
+    # L'ultimo studente prende il posto di quello cancellato: così pop() toglie
+    # l'ultimo elemento senza dover spostare tutti quelli successivi
+    indice = _registro["indice"]
+    matricole_uniche = len(indice) == len(studenti)  # Nessuna matricola ripetuta
+    studente_rimosso = studente
+    ultimo = studenti.pop()
+    if studente_index < len(studenti):
+        studenti[studente_index] = ultimo
+
+    # Aggiornamento dell'indice
+    if matricole_uniche:
+        # Cambiano solo la matricola cancellata e la posizione dell'ultimo studente
+        del indice[matricola_input]
+        if studente_index < len(studenti):
+            indice[ultimo.get("matricola")] = studente_index
+    else:
+        # Con matricole ripetute un'altra occorrenza può dover prendere il posto
+        # di quella cancellata: ricostruisce l'indice
+        _registro["indice"] = indicizza_studenti(studenti)
+
+    # Rimuove la media dello studente dalla cache
+    _media_cache.pop(id(studente_rimosso), None)
 
     # Salvataggio nel file
-    with open(percorso_file, "w", encoding="utf-8") as file:
-        json.dump(studenti, file, ensure_ascii=False, indent=2)
+    salva_studenti(percorso_file, studenti)
 
     # Conferma all'utente
     print(f"✅ Studente {nome_completo} rimosso con successo dal registro.")
@@ -291,8 +654,32 @@ if __name__ == "__main__":
         - La condizione if __name__ == "__main__": garantisce che questo codice venga eseguito solo 
           quando lo script viene avviato direttamente e non quando viene importato
         - Il menù utilizza un ciclo while infinito (interrotto solo dall'opzione di uscita)
-        - Ogni opzione chiama la funzione corrispondente passando il percorso del file dati
+        - Ogni opzione chiama la funzione corrispondente (cercata nel dizionario azioni)
+          passando il percorso del file dati
+        - Con l'argomento --importa gli studenti vengono letti dallo standard input
+          in formato JSON, senza mostrare il menù; se l'input viene rifiutato il
+          programma esce con codice 1
+        - Qualsiasi altro argomento termina il programma con un messaggio di utilizzo
     """
+    argomenti = sys.argv[1:]
+    if argomenti == ["--importa"]:
+        importazione_riuscita = aggiungi_studenti_batch(file_path, sys.stdin.buffer)
+        # Termina il programma senza mostrare il menù: il codice di uscita 1 segnala
+        # l'errore a chi ha lanciato lo script
+        sys.exit(0 if importazione_riuscita else 1)
+    elif argomenti:
+        # sys.exit() con una stringa la stampa sullo standard error ed esce con codice 1
+        sys.exit(f"❌ Argomenti non validi: {' '.join(argomenti)}\n"
+                 f"Uso: python {os.path.basename(sys.argv[0])} [--importa < studenti.json]")
+
+    # Tabella delle opzioni: associa a ogni scelta la funzione da chiamare
+    azioni = {
+        "1": esegui_processo,
+        "2": aggiungi_studente,
+        "3": aggiungi_voto,
+        "4": cancella_studente,
+    }
+
     while True:
         # Visualizza il menù delle opzioni
         print("\nCosa vuoi fare?")
@@ -303,17 +690,14 @@ if __name__ == "__main__":
         print("[0] Esci")
         scelta = input("Scelta: ").strip()
 
-        # Gestione delle diverse opzioni tramite if-elif-else
-        if scelta == "1":
-            esegui_processo(file_path)
-        elif scelta == "2":
-            aggiungi_studente(file_path)
-        elif scelta == "3":
-            aggiungi_voto(file_path)
-        elif scelta == "4":
-            cancella_studente(file_path)
-        elif scelta == "0":
+        if scelta == "0":
             print("👋 Uscita dal programma.")
             break  # Esce dal ciclo while e termina il programma
+
+        # Gestione delle diverse opzioni tramite la tabella: get() restituisce
+        # la funzione associata alla scelta, oppure None se la scelta non esiste
+        azione = azioni.get(scelta)
+        if azione:
+            azione(file_path)
         else:
             print("❌ Scelta non valida. Riprova.")